@@ -1,15 +1,23 @@
 # Import necessary libraries
-from quart import Quart, request, jsonify, abort
+from quart import Quart, Response, request, jsonify, abort
+from quart.json.provider import JSONProvider
 import asyncio
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from notion_client import AsyncClient
+import httpx
 import datetime
+import re
+import time
 from dotenv import load_dotenv
 import os
+from urllib.parse import quote
 
 # Load environment variables from a .env file for better security and configuration management
 load_dotenv()
@@ -17,67 +25,344 @@ load_dotenv()
 # Initialize Quart app
 app = Quart(__name__)
 
+# Serialize request/response JSON with orjson, which is considerably faster
+# than the stdlib encoder on the large payloads this proxy shuttles around
+class OrjsonProvider(JSONProvider):
+    def dumps(self, object_, **kwargs):
+        return orjson.dumps(object_).decode()
+
+    def loads(self, object_, **kwargs):
+        return orjson.loads(object_)
+
+app.json = OrjsonProvider(app)
+
 # Initialize Notion client with an authentication token from environment variables
 notion = AsyncClient(auth=os.getenv("NOTION_TOKEN"))
 
 # Define the Google API scope needed for calendar access
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
-async def run_in_executor(func, *args, **kwargs):
+# Dedicated pool for the Google SDK's blocking calls (credential handling and
+# batch execution), sized independently of the loop's default executor so they
+# neither queue behind nor starve other offloaded work
+CAL_EXECUTOR = ThreadPoolExecutor(max_workers=64, thread_name_prefix="gcal")
+
+async def run_in_executor(func, *args, executor=CAL_EXECUTOR, **kwargs):
     loop = asyncio.get_running_loop()
     pfunc = partial(func, *args, **kwargs)
-    return await loop.run_in_executor(None, pfunc)
-
-def get_calendar_service():
-    creds = None
-    if os.path.exists("token.json"):
-        creds = Credentials.from_authorized_user_file("token.json", SCOPES)
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+    return await loop.run_in_executor(executor, pfunc)
+
+def _error_status(exc):
+    for candidate in (exc, getattr(exc, "response", None), getattr(exc, "resp", None)):
+        if candidate is None:
+            continue
+        for attr in ("status", "status_code"):
+            value = getattr(candidate, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+def _error_retry_after(exc):
+    for candidate in (exc, getattr(exc, "response", None), getattr(exc, "resp", None)):
+        headers = getattr(candidate, "headers", None)
+        if not headers:
+            continue
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return None
+    return None
+
+class Throttler:
+    # Combines a sliding one-minute window on request starts with an AIMD
+    # concurrency limit: additive increase on success, halve on 429/5xx,
+    # pausing entirely for any Retry-After the provider sends
+    def __init__(self, max_per_minute, max_concurrency):
+        self.max_per_minute = max_per_minute
+        self.max_concurrency = max_concurrency
+        self._limit = float(max_concurrency)
+        self._active = 0
+        self._starts = deque()
+        self._resume_at = 0.0
+        self._condition = asyncio.Condition()
+
+    async def run(self, thunk):
+        await self._acquire()
+        try:
+            result = await thunk()
+        except Exception as e:
+            status = _error_status(e)
+            if status == 429 or (status is not None and status >= 500):
+                await self._on_throttle(_error_retry_after(e))
+            raise
         else:
-            flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
-            flow.redirect_uri = "http://127.0.0.1:5000/"
-            creds = flow.run_local_server(port=0)
-            with open("token.json", "w") as token:
-                token.write(creds.to_json())
+            await self._on_success()
+            return result
+        finally:
+            await self._release()
 
-    return build("calendar", "v3", credentials=creds)
+    async def _acquire(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(
+                    lambda: self._active < max(1, int(self._limit))
+                )
+                now = loop.time()
+                while self._starts and now - self._starts[0] >= 60.0:
+                    self._starts.popleft()
+                if now >= self._resume_at and len(self._starts) < self.max_per_minute:
+                    self._active += 1
+                    self._starts.append(now)
+                    return
+                delay = max(self._resume_at - now, 0.05)
+                if len(self._starts) >= self.max_per_minute:
+                    delay = max(delay, self._starts[0] + 60.0 - now)
+            await asyncio.sleep(delay)
+
+    async def _release(self):
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    async def _on_success(self):
+        async with self._condition:
+            self._limit = min(float(self.max_concurrency), self._limit + 0.5)
+            self._condition.notify()
+
+    async def _on_throttle(self, retry_after):
+        loop = asyncio.get_running_loop()
+        async with self._condition:
+            self._limit = max(1.0, self._limit * 0.5)
+            if retry_after:
+                self._resume_at = max(self._resume_at, loop.time() + retry_after)
+
+# Notion allows roughly 3 requests/second; Calendar's per-user quota is far
+# higher, so its window mainly guards against burst 429s
+notion_throttler = Throttler(max_per_minute=180, max_concurrency=8)
+calendar_throttler = Throttler(max_per_minute=600, max_concurrency=32)
+
+# Cached Google Calendar service, built once and reused across requests
+_calendar_creds = None
+_calendar_service = None
+_calendar_service_lock = asyncio.Lock()
+
+def _load_creds_sync():
+    if os.path.exists("token.json"):
+        return Credentials.from_authorized_user_file("token.json", SCOPES)
+    return None
+
+def _save_creds_sync(creds):
+    # Write to a temp file and atomically swap it in, so a crash mid-write can
+    # never leave a truncated token.json behind
+    tmp_path = "token.json.tmp"
+    with open(tmp_path, "w") as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, "token.json")
+
+def _refresh_creds_sync(creds):
+    creds.refresh(Request())
+    _save_creds_sync(creds)
+
+def _authorize_creds_sync():
+    flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
+    flow.redirect_uri = "http://127.0.0.1:5000/"
+    creds = flow.run_local_server(port=0)
+    _save_creds_sync(creds)
+    return creds
+
+def _build_service_sync(creds):
+    return build(
+        "calendar",
+        "v3",
+        credentials=creds,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+async def get_calendar_creds_cached():
+    global _calendar_creds
+    async with _calendar_service_lock:
+        if _calendar_creds is None:
+            creds = await run_in_executor(_load_creds_sync)
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    await run_in_executor(_refresh_creds_sync, creds)
+                else:
+                    creds = await run_in_executor(_authorize_creds_sync)
+            _calendar_creds = creds
+        elif _calendar_creds.expired and _calendar_creds.refresh_token:
+            await run_in_executor(_refresh_creds_sync, _calendar_creds)
+    return _calendar_creds
+
+async def get_calendar_service_cached():
+    global _calendar_service
+    creds = await get_calendar_creds_cached()
+    async with _calendar_service_lock:
+        if _calendar_service is None:
+            _calendar_service = await run_in_executor(_build_service_sync, creds)
+    return _calendar_service
+
+# Direct REST access to the Calendar API over a shared HTTP/2 client, so many
+# concurrent calls multiplex over a few persistent TLS connections instead of
+# paying a handshake each
+CALENDAR_API_BASE = "https://www.googleapis.com/calendar/v3"
+
+_http_client = None
+
+async def get_http_client():
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _http_client
+
+@app.after_serving
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+class CalendarAPIError(RuntimeError):
+    def __init__(self, status, body, headers=None):
+        super().__init__(f"Calendar API error {status}: {body}")
+        self.status = status
+        self.headers = headers or {}
+
+async def _calendar_request(method, path, params=None, json_body=None):
+    creds = await get_calendar_creds_cached()
+    client = await get_http_client()
+    headers = {"Authorization": f"Bearer {creds.token}"}
+
+    async def send():
+        response = await client.request(
+            method,
+            CALENDAR_API_BASE + path,
+            params=params,
+            json=json_body,
+            headers=headers,
+        )
+        if response.status_code >= 400:
+            raise CalendarAPIError(
+                response.status_code, response.text, dict(response.headers)
+            )
+        if response.status_code == 204:
+            return None
+        return response.json()
+
+    return await calendar_throttler.run(send)
+
+async def _iter_event_pages(calendar_id, time_min, time_max):
+    async def fetch_page(page_token):
+        params = {
+            "timeMin": time_min,
+            "singleEvents": "true",
+            "orderBy": "startTime",
+            "maxResults": 2500,
+        }
+        if time_max:
+            params["timeMax"] = time_max
+        if page_token:
+            params["pageToken"] = page_token
+        return await _calendar_request(
+            "GET", f"/calendars/{quote(calendar_id)}/events", params=params
+        )
+
+    # Page tokens are sequential, so the best overlap is fetching page N+1
+    # while the caller consumes page N
+    next_task = asyncio.create_task(fetch_page(None))
+    try:
+        while next_task is not None:
+            events_result = await next_task
+            page_token = events_result.get("nextPageToken")
+            if page_token:
+                next_task = asyncio.create_task(fetch_page(page_token))
+            else:
+                next_task = None
+            yield events_result.get("items", [])
+    finally:
+        # If the consumer stops early, drop the speculative fetch instead of
+        # letting it run (and hold a throttler slot) for a discarded result
+        if next_task is not None:
+            next_task.cancel()
+
+# Default time_min changes at most once per second, so cache the formatted
+# string instead of building a datetime per request
+_utc_now_cache = (0, "")
+
+def _utc_now_iso():
+    global _utc_now_cache
+    second = int(time.time())
+    cached_second, cached_value = _utc_now_cache
+    if second != cached_second:
+        cached_value = (
+            datetime.datetime.now(datetime.UTC)
+            .isoformat(timespec="seconds")
+            .replace("+00:00", "Z")
+        )
+        _utc_now_cache = (second, cached_value)
+    return cached_value
+
+def _stream_json_array(items):
+    # Serialize items one by one as they arrive, so memory stays at one page
+    # and the first byte goes out before the last page is fetched
+    async def generate():
+        yield "["
+        first = True
+        async for item in items:
+            prefix = "" if first else ","
+            first = False
+            yield prefix + orjson.dumps(item).decode()
+        yield "]"
+
+    return Response(generate(), content_type="application/json")
 
 @app.route("/read_events", methods=["GET"])
 async def read_events():
-    service = get_calendar_service()
     calendar_id = request.args.get("calendar_id", "primary")
-    time_min = request.args.get("time_min", datetime.datetime.utcnow().isoformat() + "Z")
+    time_min = request.args.get("time_min", _utc_now_iso())
     time_max = request.args.get("time_max", None)
 
-    events = []
-    page_token = None
+    page_iter = _iter_event_pages(calendar_id, time_min, time_max)
 
+    # Fetch the first page eagerly so obvious errors still produce a 500
+    # instead of dying mid-stream
     try:
-        while True:
-            list_request = service.events().list(
-                calendarId=calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy="startTime",
-                pageToken=page_token,
-                maxResults=2500
-            )
-            events_result = await run_in_executor(list_request.execute)
-            events.extend(events_result.get("items", []))
-            page_token = events_result.get("nextPageToken")
-            if not page_token:
-                break
-        return jsonify(events)
+        first_page = await anext(page_iter)
     except Exception as e:
         abort(500, description=str(e))
 
+    async def iter_events():
+        for event in first_page:
+            yield event
+        async for items in page_iter:
+            for event in items:
+                yield event
+
+    return _stream_json_array(iter_events())
+
+# Cheap shape check for event timestamps, so obvious garbage is rejected
+# before spending a Calendar round-trip on it
+_ISO_RE = re.compile(r"^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d")
+
+def _valid_iso_time(value):
+    return isinstance(value, str) and _ISO_RE.match(value) is not None
+
+def _attendee_entry(email):
+    return {"email": email}
+
+def _attendee_list(attendees):
+    # map over a named helper skips the comprehension frame per item, which
+    # adds up on large invite lists
+    return list(map(_attendee_entry, attendees))
+
 @app.route("/create_event", methods=["POST"])
 async def create_event():
-    service = get_calendar_service()
     data = await request.get_json()
 
     calendar_id = data.get("calendar_id", "primary")
@@ -89,35 +374,42 @@ async def create_event():
 
     if not all([summary, start_time, end_time]):
         abort(400, description="Missing required event fields.")
+    if not _valid_iso_time(start_time) or not _valid_iso_time(end_time):
+        abort(400, description="start_time and end_time must be ISO-8601 timestamps.")
 
     event = {
         "summary": summary,
         "description": description,
         "start": {"dateTime": start_time},
         "end": {"dateTime": end_time},
-        "attendees": [{"email": attendee} for attendee in attendees],
+        "attendees": _attendee_list(attendees),
     }
 
     try:
-        insert_request = service.events().insert(calendarId=calendar_id, body=event)
-        created_event = await run_in_executor(insert_request.execute)
+        created_event = await _calendar_request(
+            "POST", f"/calendars/{quote(calendar_id)}/events", json_body=event
+        )
         return jsonify(created_event)
     except Exception as e:
         abort(500, description=str(e))
 
 @app.route("/edit_event", methods=["PUT"])
 async def edit_event():
-    service = get_calendar_service()
     data = await request.get_json()
 
     calendar_id = data.get("calendar_id", "primary")
     event_id = data.get("event_id")
     if not event_id:
         abort(400, description="Event ID is required.")
+    for field in ("start_time", "end_time"):
+        value = data.get(field)
+        if value is not None and not _valid_iso_time(value):
+            abort(400, description=f"{field} must be an ISO-8601 timestamp.")
 
     try:
-        get_request = service.events().get(calendarId=calendar_id, eventId=event_id)
-        event = await run_in_executor(get_request.execute)
+        event = await _calendar_request(
+            "GET", f"/calendars/{quote(calendar_id)}/events/{quote(event_id)}"
+        )
     except Exception as e:
         abort(500, description=f"Error retrieving event: {str(e)}")
 
@@ -136,18 +428,20 @@ async def edit_event():
     if end_time is not None:
         event["end"] = {"dateTime": end_time}
     if attendees is not None:
-        event["attendees"] = [{"email": attendee} for attendee in attendees]
+        event["attendees"] = _attendee_list(attendees)
 
     try:
-        update_request = service.events().update(calendarId=calendar_id, eventId=event_id, body=event)
-        updated_event = await run_in_executor(update_request.execute)
+        updated_event = await _calendar_request(
+            "PUT",
+            f"/calendars/{quote(calendar_id)}/events/{quote(event_id)}",
+            json_body=event,
+        )
         return jsonify(updated_event)
     except Exception as e:
         abort(500, description=f"Error updating event: {str(e)}")
 
 @app.route("/delete_event", methods=["DELETE"])
 async def delete_event():
-    service = get_calendar_service()
     calendar_id = request.args.get("calendar_id", "primary")
     event_id = request.args.get("event_id")
 
@@ -155,17 +449,188 @@ async def delete_event():
         abort(400, description="Event ID is required.")
 
     try:
-        delete_request = service.events().delete(calendarId=calendar_id, eventId=event_id)
-        await run_in_executor(delete_request.execute)
+        await _calendar_request(
+            "DELETE", f"/calendars/{quote(calendar_id)}/events/{quote(event_id)}"
+        )
         return jsonify({"status": "success", "message": "Event deleted successfully"})
     except Exception as e:
         abort(500, description=str(e))
 
+# Calendar's batch endpoint accepts at most 50 subrequests per call
+BATCH_LIMIT = 50
+
+async def _execute_calendar_batch(service, batch_requests):
+    results = {}
+
+    def callback(request_id, response, exception):
+        if exception is not None:
+            results[request_id] = {"status": "error", "error": str(exception)}
+        else:
+            results[request_id] = {"status": "success", "response": response}
+
+    for start in range(0, len(batch_requests), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id, api_request in batch_requests[start:start + BATCH_LIMIT]:
+            batch.add(api_request, request_id=request_id)
+        await calendar_throttler.run(lambda: run_in_executor(batch.execute))
+
+    return results
+
+@app.route("/create_events_batch", methods=["POST"])
+async def create_events_batch():
+    service = await get_calendar_service_cached()
+    data = await request.get_json()
+
+    if not isinstance(data, list) or not data:
+        abort(400, description="A non-empty JSON array of events is required.")
+
+    batch_requests = []
+    for index, item in enumerate(data):
+        calendar_id = item.get("calendar_id", "primary")
+        summary = item.get("summary")
+        description = item.get("description")
+        start_time = item.get("start_time")
+        end_time = item.get("end_time")
+        attendees = item.get("attendees", [])
+
+        if not all([summary, start_time, end_time]):
+            abort(400, description=f"Missing required event fields at index {index}.")
+        if not _valid_iso_time(start_time) or not _valid_iso_time(end_time):
+            abort(400, description=f"start_time and end_time must be ISO-8601 timestamps at index {index}.")
+
+        event = {
+            "summary": summary,
+            "description": description,
+            "start": {"dateTime": start_time},
+            "end": {"dateTime": end_time},
+            "attendees": _attendee_list(attendees),
+        }
+        request_id = str(item.get("request_id", index))
+        batch_requests.append((request_id, service.events().insert(calendarId=calendar_id, body=event)))
+
+    try:
+        results = await _execute_calendar_batch(service, batch_requests)
+        return jsonify(results)
+    except Exception as e:
+        abort(500, description=str(e))
+
+@app.route("/delete_events_batch", methods=["DELETE"])
+async def delete_events_batch():
+    service = await get_calendar_service_cached()
+    data = await request.get_json()
+
+    if not isinstance(data, list) or not data:
+        abort(400, description="A non-empty JSON array of events is required.")
+
+    batch_requests = []
+    for index, item in enumerate(data):
+        calendar_id = item.get("calendar_id", "primary")
+        event_id = item.get("event_id")
+
+        if not event_id:
+            abort(400, description=f"Event ID is required at index {index}.")
+
+        request_id = str(item.get("request_id", index))
+        batch_requests.append((request_id, service.events().delete(calendarId=calendar_id, eventId=event_id)))
+
+    try:
+        results = await _execute_calendar_batch(service, batch_requests)
+        return jsonify(results)
+    except Exception as e:
+        abort(500, description=str(e))
+
+# Short-TTL caches keyed by request, with coalescing so concurrent callers
+# for the same key share a single in-flight Notion call
+SCHEMA_CACHE_TTL = 60.0
+SEARCH_CACHE_TTL = 30.0
+
+_notion_cache = {}
+
+def _consume_task_exception(task):
+    # Keep asyncio from logging "exception was never retrieved" when every
+    # caller of a shared task went away before it failed
+    if not task.cancelled():
+        task.exception()
+
+async def _cached_call(key, ttl, thunk):
+    loop = asyncio.get_running_loop()
+    entry = _notion_cache.get(key)
+    if entry is not None:
+        expires_at, task = entry
+        if expires_at > loop.time():
+            return await asyncio.shield(task)
+
+    async def fill():
+        try:
+            return await thunk()
+        except BaseException:
+            current = _notion_cache.get(key)
+            if current is not None and current[1] is task:
+                del _notion_cache[key]
+            raise
+
+    # Run the fill in its own task: if the creating request is cancelled
+    # (client disconnect), the fill still completes and resolves the entry
+    # for coalesced waiters instead of stranding them on a pending future
+    task = loop.create_task(fill())
+    task.add_done_callback(_consume_task_exception)
+    _notion_cache[key] = (loop.time() + ttl, task)
+    return await asyncio.shield(task)
+
+# Singleflight for idempotent reads we do not want to cache: concurrent
+# callers for the same key share one in-flight request, with no TTL
+_inflight = {}
+
+async def _single_flight(key, thunk):
+    existing = _inflight.get(key)
+    if existing is not None:
+        return await asyncio.shield(existing)
+
+    loop = asyncio.get_running_loop()
+
+    async def run():
+        try:
+            return await thunk()
+        finally:
+            if _inflight.get(key) is task:
+                del _inflight[key]
+
+    # As with _cached_call, the shared work runs in its own task so a
+    # cancelled leader cannot leave coalesced waiters on a pending future
+    task = loop.create_task(run())
+    task.add_done_callback(_consume_task_exception)
+    _inflight[key] = task
+    return await asyncio.shield(task)
+
+def _invalidate_schema_cache():
+    for key in [key for key in _notion_cache if key[0] == "database_schema"]:
+        del _notion_cache[key]
+
+async def notion_search_all(search_filter):
+    results = []
+    start_cursor = None
+
+    while True:
+        response = await notion_throttler.run(
+            lambda: notion.search(
+                filter=search_filter, start_cursor=start_cursor, page_size=100
+            )
+        )
+        results.extend(response.get("results", []))
+        if not response.get("has_more"):
+            break
+        start_cursor = response.get("next_cursor")
+
+    return results
+
 @app.route("/list_notion_databases", methods=["GET"])
 async def list_notion_databases():
     try:
-        response = await notion.search(filter={"property": "object", "value": "database"})
-        databases = response.get("results", [])
+        databases = await _cached_call(
+            ("search", "database"),
+            SEARCH_CACHE_TTL,
+            lambda: notion_search_all({"property": "object", "value": "database"}),
+        )
         databases_info = [
             {
                 "id": db["id"],
@@ -180,16 +645,14 @@ async def list_notion_databases():
 @app.route("/list_notion_pages", methods=["GET"])
 async def list_notion_pages():
     try:
-        response = await notion.search(filter={"property": "object", "value": "page"})
-        pages = response.get("results", [])
+        pages = await _single_flight(
+            ("search", "page"),
+            lambda: notion_search_all({"property": "object", "value": "page"}),
+        )
         page_list = []
         for page in pages:
-            title = "Unnamed Page"
-            if "title" in page.get("properties", {}):
-                try:
-                    title = page["properties"]["title"]["title"][0]["plain_text"]
-                except (IndexError, KeyError):
-                    pass
+            title_list = page.get("properties", {}).get("title", {}).get("title") or []
+            title = title_list[0].get("plain_text", "Unnamed Page") if title_list else "Unnamed Page"
             page_info = {
                 "id": page["id"],
                 "title": title,
@@ -202,57 +665,74 @@ async def list_notion_pages():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-async def retrieve_all_blocks(block_id):
-    try:
-        collected_blocks = []
-        blocks_to_process = [block_id]
-
-        while blocks_to_process:
-            current_block_id = blocks_to_process.pop()
-            response = await notion.blocks.children.list(block_id=current_block_id)
-            block_children = response.get("results", [])
+# Upper bound on concurrent Notion block-children fetches per page walk
+BLOCK_FETCH_CONCURRENCY = 8
 
+async def retrieve_all_blocks(block_id):
+    blocks_to_process = [block_id]
+    semaphore = asyncio.Semaphore(BLOCK_FETCH_CONCURRENCY)
+
+    async def fetch_children(current_block_id):
+        block_children = []
+        start_cursor = None
+        async with semaphore:
+            while True:
+                response = await notion_throttler.run(
+                    lambda: notion.blocks.children.list(
+                        block_id=current_block_id,
+                        start_cursor=start_cursor,
+                        page_size=100,
+                    )
+                )
+                block_children.extend(response.get("results", []))
+                if not response.get("has_more"):
+                    break
+                start_cursor = response.get("next_cursor")
+        return block_children
+
+    while blocks_to_process:
+        responses = await asyncio.gather(
+            *(fetch_children(current_id) for current_id in blocks_to_process)
+        )
+        blocks_to_process = []
+        for block_children in responses:
             for block in block_children:
-                collected_blocks.append(block)
                 if block.get("has_children", False):
                     blocks_to_process.append(block["id"])
-
-        return collected_blocks
-    except Exception as e:
-        return str(e)
-
-def extract_text_from_blocks(blocks):
-    text_content = []
-
-    for block in blocks:
-        block_type = block.get("type")
-        block_data = block.get(block_type, {})
-
-        if block_type in [
-            "paragraph",
-            "heading_1",
-            "heading_2",
-            "heading_3",
-            "bulleted_list_item",
-            "numbered_list_item",
-            "to_do",
-        ]:
-            text_elements = block_data.get("rich_text", [])
-            text_pieces = [element.get("plain_text", "") for element in text_elements]
-            if block_type in ["heading_1", "heading_2", "heading_3"]:
-                text_content.append("**" + "".join(text_pieces) + "**")
-            else:
-                text_content.append("".join(text_pieces))
-
-        elif block_type == "child_page":
-            page_title = block_data.get("title", "")
-            text_content.append(page_title)
-
-    return text_content
+                yield block
+
+_TEXT_BLOCK_TYPES = frozenset({
+    "paragraph",
+    "heading_1",
+    "heading_2",
+    "heading_3",
+    "bulleted_list_item",
+    "numbered_list_item",
+    "to_do",
+})
+_HEADING_TYPES = frozenset({"heading_1", "heading_2", "heading_3"})
+
+def _extract_block_text(block):
+    block_type = block.get("type")
+    block_data = block.get(block_type, {})
+
+    if block_type in _TEXT_BLOCK_TYPES:
+        text = "".join(
+            element.get("plain_text", "") for element in block_data.get("rich_text", ())
+        )
+        if block_type in _HEADING_TYPES:
+            yield "**" + text + "**"
+        else:
+            yield text
+    elif block_type == "child_page":
+        yield block_data.get("title", "")
 
 async def get_all_text_on_page(page_id):
-    blocks = await retrieve_all_blocks(page_id)
-    return extract_text_from_blocks(blocks)
+    return [
+        text
+        async for block in retrieve_all_blocks(page_id)
+        for text in _extract_block_text(block)
+    ]
 
 @app.route("/get_text_from_notion_page", methods=["GET"])
 async def get_text_from_notion_page():
@@ -280,7 +760,13 @@ async def get_notion_database_pages():
 
 async def get_database_schema(database_id):
     try:
-        return await notion.databases.retrieve(database_id=database_id)
+        return await _cached_call(
+            ("database_schema", database_id),
+            SCHEMA_CACHE_TTL,
+            lambda: notion_throttler.run(
+                lambda: notion.databases.retrieve(database_id=database_id)
+            ),
+        )
     except Exception as e:
         return str(e)
 
@@ -306,7 +792,10 @@ async def update_notion_database_entry():
         return jsonify({"error": "Page ID and updated properties are required"}), 400
 
     try:
-        result = await notion.pages.update(page_id=page_id, properties=updated_properties)
+        result = await notion_throttler.run(
+            lambda: notion.pages.update(page_id=page_id, properties=updated_properties)
+        )
+        _invalidate_schema_cache()
         return jsonify(result)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -329,11 +818,60 @@ async def create_notion_entry():
         new_page["children"] = content
 
     try:
-        response = await notion.pages.create(**new_page)
+        response = await notion_throttler.run(lambda: notion.pages.create(**new_page))
         return jsonify(response)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+async def _iter_database_pages(
+    database_id,
+    filter,
+    sorts,
+    page_size,
+    start_cursor=None,
+    max_results=None,
+    auto_paginate=True,
+):
+    async def fetch_page(cursor, size):
+        return await notion_throttler.run(
+            lambda: notion.databases.query(
+                database_id=database_id,
+                filter=filter,
+                sorts=sorts,
+                start_cursor=cursor,
+                page_size=size
+            )
+        )
+
+    def remaining_size():
+        if max_results is None:
+            return page_size
+        # Clamp to the remaining budget so a max_results stop always falls on
+        # a page boundary: Notion cursors are page-aligned, and a mid-page cut
+        # would make the reported next_cursor skip the rest of that page
+        return max(1, min(page_size, max_results - fetched))
+
+    fetched = 0
+    next_task = asyncio.create_task(fetch_page(start_cursor, remaining_size()))
+    try:
+        while next_task is not None:
+            response = await next_task
+            fetched += len(response.get("results", []))
+            if (
+                auto_paginate
+                and response.get("has_more")
+                and (max_results is None or fetched < max_results)
+            ):
+                next_task = asyncio.create_task(
+                    fetch_page(response.get("next_cursor"), remaining_size())
+                )
+            else:
+                next_task = None
+            yield response
+    finally:
+        if next_task is not None:
+            next_task.cancel()
+
 @app.route("/query_notion_database", methods=["POST"])
 async def query_notion_database():
     data = await request.get_json()
@@ -341,31 +879,56 @@ async def query_notion_database():
     filter = data.get("filter")
     sorts = data.get("sorts")
     page_size = data.get("page_size", 100)
+    start_cursor = data.get("start_cursor")
+    max_results = data.get("max_results")
+    auto_paginate = data.get("auto_paginate", True)
 
     if not database_id:
         return jsonify({"error": "Database ID is required"}), 400
 
-    results = []
-    start_cursor = None
+    page_iter = _iter_database_pages(
+        database_id,
+        filter,
+        sorts,
+        page_size,
+        start_cursor=start_cursor,
+        max_results=max_results,
+        auto_paginate=auto_paginate,
+    )
 
     try:
+        first_response = await anext(page_iter)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    # Stream results as they arrive and close with the cursor the caller can
+    # pass back as start_cursor to resume where this response stopped
+    async def generate():
+        yield '{"results":['
+        emitted = 0
+        first = True
+        next_cursor = None
+        response = first_response
         while True:
-            response = await notion.databases.query(
-                database_id=database_id,
-                filter=filter,
-                sorts=sorts,
-                start_cursor=start_cursor,
-                page_size=page_size
-            )
-            results.extend(response.get("results", []))
-            has_more = response.get("has_more")
-            start_cursor = response.get("next_cursor")
-            if not has_more:
+            for item in response.get("results", []):
+                if max_results is not None and emitted >= max_results:
+                    break
+                prefix = "" if first else ","
+                first = False
+                emitted += 1
+                yield prefix + orjson.dumps(item).decode()
+            next_cursor = response.get("next_cursor") if response.get("has_more") else None
+            try:
+                response = await anext(page_iter)
+            except StopAsyncIteration:
                 break
+        yield '],"next_cursor":' + orjson.dumps(next_cursor).decode() + "}"
 
-        return jsonify(results)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return Response(generate(), content_type="application/json")
 
 if __name__ == "__main__":
+    # Use uvloop for the dev server too; production runs under Hypercorn with
+    # --worker-class uvloop (see README)
+    import uvloop
+    uvloop.install()
     app.run()
\ No newline at end of file